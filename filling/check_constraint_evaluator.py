@@ -32,6 +32,7 @@ class CheckConstraintEvaluator:
          """
         self.expression_parser = self._create_expression_parser()
         self.schema_columns = schema_columns or []
+        self._parsed_expressions = {}
 
     def _create_expression_parser(self):
         """
@@ -98,6 +99,28 @@ class CheckConstraintEvaluator:
 
         return expr
 
+    def _parse(self, check_expression: str):
+        """
+        Parse a CHECK constraint expression, reusing the parse tree from earlier calls for the same expression.
+
+        The same handful of CHECK constraints is evaluated for every generated row, so parsing each of them once
+        avoids re-running the Pyparsing grammar per row.
+
+        Args:
+            check_expression (str): The CHECK constraint expression to parse.
+
+        Returns:
+            ParseResults: The parsed expression tree.
+
+        Raises:
+            ParseException: If the expression cannot be parsed.
+        """
+        parsed_expr = self._parsed_expressions.get(check_expression)
+        if parsed_expr is None:
+            parsed_expr = self.expression_parser.parseString(check_expression, parseAll=True)[0]
+            self._parsed_expressions[check_expression] = parsed_expr
+        return parsed_expr
+
     def extract_conditions(self, check_expression: str) -> dict:
         """
         Extract conditions from a CHECK constraint expression.
@@ -109,7 +132,7 @@ class CheckConstraintEvaluator:
             dict: A dictionary mapping column names to their respective conditions extracted from the constraint.
         """
         try:
-            parsed_expr = self.expression_parser.parseString(check_expression, parseAll=True)[0]
+            parsed_expr = self._parse(check_expression)
             conditions = self._extract_conditions_recursive(parsed_expr)
             return conditions
         except Exception as e:
@@ -284,7 +307,7 @@ class CheckConstraintEvaluator:
             bool: True if the row satisfies the CHECK constraint, False otherwise.
         """
         try:
-            parsed_expr = self.expression_parser.parseString(check_expression, parseAll=True)[0]
+            parsed_expr = self._parse(check_expression)
             result = self._evaluate_expression(parsed_expr, row)
             return bool(result)
         except Exception as e:
@@ -371,7 +394,7 @@ class CheckConstraintEvaluator:
             ValueError: If the argument format is unsupported.
         """
         if isinstance(arg, str):
-            return datetime.strptime(arg, '%Y-%m-%d').date()
+            return self._parse_date_string(arg)
         elif isinstance(arg, datetime):
             return arg.date()
         elif isinstance(arg, date):
@@ -379,6 +402,20 @@ class CheckConstraintEvaluator:
         else:
             raise ValueError(f"Unsupported argument for DATE function: {arg}")
 
+    def _parse_date_string(self, value: str) -> date:
+        """
+        Parse a 'YYYY-MM-DD' string into a date.
+
+        Strictly shaped strings take the `date.fromisoformat` fast path. Anything else goes through
+        `strptime`, because `fromisoformat` accepts extra formats (e.g. '20240105') on Python 3.11+.
+
+        Raises:
+            ValueError: If the string is not a valid 'YYYY-MM-DD' date.
+        """
+        if len(value) == 10 and value[4] == value[7] == '-':
+            return date.fromisoformat(value)
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
     def apply_operator(self, left, operator: str, right):
         """
         Apply a binary operator to two operands.
@@ -588,7 +625,7 @@ class CheckConstraintEvaluator:
                 source = date.today()
             else:
                 try:
-                    source = datetime.strptime(source, '%Y-%m-%d')
+                    source = self._parse_date_string(source)
                 except ValueError:
                     source = datetime.now()
         if isinstance(source, datetime):
@@ -1,6 +1,7 @@
 import itertools
 import random
 from datetime import datetime, date, timedelta
+from typing import Optional
 
 from faker import Faker
 
@@ -9,6 +10,9 @@ from .helpers import *
 
 ParserElement.enablePackrat()
 
+# Lower bound for DATE columns whose CHECK constraints give no minimum
+MIN_GENERATED_DATE = date(1900, 1, 1)
+
 
 class DataGenerator:
     """
@@ -25,7 +29,7 @@ class DataGenerator:
     """
 
     def __init__(self, tables, num_rows=10, predefined_values=None, column_type_mappings=None,
-                 num_rows_per_table=None):
+                 num_rows_per_table=None, faker=None):
         """
         Initialize the DataGenerator with table schemas and configuration settings.
 
@@ -35,6 +39,7 @@ class DataGenerator:
             predefined_values (dict, optional): Predefined values for specific columns to ensure consistency. Defaults to None.
             column_type_mappings (dict, optional): Mappings of column names to specific data generation functions or types. Defaults to None.
             num_rows_per_table (dict, optional): Specific number of rows to generate for each table. Overrides `num_rows` if provided. Defaults to None.
+            faker (Faker, optional): A Faker instance to generate values with, so several generators can share one (and its seed). Defaults to None, which creates a new instance.
         """
         self.tables = tables
         self.num_rows = num_rows
@@ -42,7 +47,7 @@ class DataGenerator:
         self.generated_data = {}
         self.primary_keys = {}
         self.unique_values = {}
-        self.fake = Faker()
+        self.fake = faker if faker is not None else Faker()
         self.table_order = self.resolve_table_order()
         self.initialize_primary_keys()
         self.check_evaluator = CheckConstraintEvaluator(schema_columns=self.get_all_column_names())
@@ -171,9 +176,8 @@ class DataGenerator:
                 # Composite PK => use generate_composite_primary_keys
                 self.generate_composite_primary_keys(table, num_rows)
             else:
-                # No primary key => generate empty rows
-                for _ in range(num_rows):
-                    self.generated_data[table].append({})
+                # No primary key => generate empty rows in a single comprehension
+                self.generated_data[table] = [{} for _ in range(num_rows)]
 
     def generate_composite_primary_keys(self, table: str, num_rows: int):
         pk_columns = self.tables[table]['primary_key']
@@ -200,14 +204,11 @@ class DataGenerator:
                 col_info = self.get_column_info(table, pk)
                 constraints = col_info.get('constraints', [])
 
-                # We'll produce num_rows possible values by calling generate_column_value each time.
-                generated_list = []
-                for _ in range(num_rows):
-                    # We pass a temporary empty row (or partial row) to generate_column_value
-                    val = self.generate_column_value(table, col_info, {}, constraints)
-                    generated_list.append(val)
-
-                pk_values[pk] = generated_list
+                # We'll produce num_rows possible values by calling generate_column_value each time,
+                # passing a temporary empty row
+                pk_values[pk] = [
+                    self.generate_column_value(table, col_info, {}, constraints) for _ in range(num_rows)
+                ]
 
         # Now produce the Cartesian product of all PK columns
         combinations = list(set(itertools.product(*(pk_values[pk] for pk in pk_columns))))
@@ -223,11 +224,7 @@ class DataGenerator:
             num_rows = max_possible_rows
 
         # Create rows using the chosen number of combinations
-        for i in range(num_rows):
-            row = {}
-            for idx, pk in enumerate(pk_columns):
-                row[pk] = combinations[i][idx]
-            self.generated_data[table].append(row)
+        self.generated_data[table] = [dict(zip(pk_columns, combination)) for combination in combinations[:num_rows]]
 
     def generate_primary_keys(self, table: str, num_rows: int):
         """
@@ -244,15 +241,12 @@ class DataGenerator:
             return
 
         col_type = col_info['type'].upper()
-        # We'll store our new rows in a temporary list (instead of the row-by-row approach)
-        new_rows = []
 
         if col_info.get("is_serial") or re.search(r'(INT|BIGINT|SMALLINT|DECIMAL|NUMERIC)', col_type):
             # Numeric or is_serial => auto-increment
             start_val = self.primary_keys[table][pk_col]
-            for i in range(num_rows):
-                row = {pk_col: start_val + i}
-                new_rows.append(row)
+            # Build the rows in a single comprehension
+            new_rows = [{pk_col: pk_val} for pk_val in range(start_val, start_val + num_rows)]
             # Update the counter
             self.primary_keys[table][pk_col] = start_val + num_rows
 
@@ -271,10 +265,8 @@ class DataGenerator:
                     used_values.add(tmp_val)
                     values_list.append(tmp_val)
 
-            # Now assign them row by row
-            for val in values_list:
-                row = {pk_col: val}
-                new_rows.append(row)
+            # Now wrap each value in its row
+            new_rows = [{pk_col: val} for val in values_list]
 
         # Finally, store the new rows
         self.generated_data[table] = new_rows
@@ -314,10 +306,11 @@ class DataGenerator:
             ref_table = fk['ref_table']  # e.g. 'Seats'
             ref_columns = fk['ref_columns']  # e.g. ['row', 'seat', 'theater_id']
 
-            # We'll check child's existing FK columns to see if they're set
+            # We'll check child's existing FK columns to see if they're set,
+            # reading each one once and reusing the values below
             child_values = [row.get(fc) for fc in fk_columns]
-            all_set = all(v is not None for v in child_values)
-            partially_set = any(v is not None for v in child_values) and not all_set
+            all_set = None not in child_values
+            partially_set = not all_set and any(v is not None for v in child_values)
 
             # Potential parent rows
             parent_data = self.generated_data[ref_table]
@@ -326,11 +319,11 @@ class DataGenerator:
             # 1) If all columns are already set, see if there's a matching parent row
             # ─────────────────────────────────────────
             if all_set:
-                matching_parents = [
-                    p for p in parent_data
-                    if all(p[rc] == row[fc] for rc, fc in zip(ref_columns, fk_columns))
-                ]
-                if matching_parents:
+                has_matching_parent = any(
+                    all(p[rc] == child_val for rc, child_val in zip(ref_columns, child_values))
+                    for p in parent_data
+                )
+                if has_matching_parent:
                     # We do nothing: child's columns already match a valid parent
                     continue
                 else:
@@ -347,8 +340,7 @@ class DataGenerator:
                 possible_parents = []
                 for p in parent_data:
                     is_candidate = True
-                    for rc, fc in zip(ref_columns, fk_columns):
-                        child_val = row.get(fc)
+                    for rc, child_val in zip(ref_columns, child_values):
                         # If child_val is set, parent must match
                         if child_val is not None and p[rc] != child_val:
                             is_candidate = False
@@ -364,8 +356,8 @@ class DataGenerator:
                     chosen_parent = random.choice(possible_parents)
 
                 # Fill any missing columns from the chosen parent
-                for rc, fc in zip(ref_columns, fk_columns):
-                    if row.get(fc) is None:
+                for rc, fc, child_val in zip(ref_columns, fk_columns, child_values):
+                    if child_val is None:
                         row[fc] = chosen_parent[rc]
                 continue
 
@@ -667,7 +659,7 @@ class DataGenerator:
             max_value = max_value if max_value is not None else 10000
             generated_value = random.uniform(int(min_value), int(max_value))
         elif 'DATE' in col_type:
-            min_date = min_value if isinstance(min_value, date) else date(1900, 1, 1)
+            min_date = min_value if isinstance(min_value, date) else MIN_GENERATED_DATE
             max_date = max_value if isinstance(max_value, date) else date.today()
             delta = (max_date - min_date).days
             random_days = random.randint(0, delta)
@@ -744,6 +736,24 @@ class DataGenerator:
         self.print_statistics()
         return self.generated_data
 
+    def get_columnar_data(self) -> dict:
+        """
+        Return the generated data in a column-oriented layout.
+
+        Rows are stored as one dictionary per row, which is convenient for generation and export but
+        wasteful when a caller only needs whole columns (e.g. collecting key sets for foreign key checks).
+        This transposes every table once into plain per-column lists.
+
+        Returns:
+            dict: A dictionary mapping each table name to a dictionary of column name -> list of values,
+                  with columns in schema order and values in row order.
+        """
+        columnar_data = {}
+        for table_name, records in self.generated_data.items():
+            columns = [col['name'] for col in self.tables[table_name]['columns']]
+            columnar_data[table_name] = {col: [record.get(col) for record in records] for col in columns}
+        return columnar_data
+
     def export_as_sql_insert_query(self, max_rows_per_insert: int = 1000) -> str:
         """
         Export the generated synthetic data as SQL INSERT queries, splitting rows into chunks
@@ -867,6 +877,29 @@ class DataGenerator:
         # All constraints passed
         return True, None
 
+    def validate_rows_bulk(self, table: str, rows: Optional[list] = None) -> list:
+        """
+        Validate many rows of a table against its NOT NULL, UNIQUE and CHECK constraints.
+
+        Every row is checked with `is_row_valid`, so both methods always apply the same rules.
+
+        Args:
+            table (str): The name of the table the rows belong to.
+            rows (list, optional): The rows to validate. Defaults to the generated data of `table`.
+
+        Returns:
+            list: A list of `(index, violated_constraint)` tuples, one per invalid row, ordered by row index.
+        """
+        if rows is None:
+            rows = self.generated_data.get(table, [])
+
+        return [
+            (index, violated_constraint)
+            for index, row in enumerate(rows)
+            for is_valid, violated_constraint in (self.is_row_valid(table, row),)
+            if not is_valid
+        ]
+
     def remove_dependent_data(self, table: str, row: dict):
         """
         Recursively remove dependent rows in child tables that reference a deleted parent row.
@@ -911,7 +944,9 @@ class DataGenerator:
 
         This method provides a summary of the data generation process, helping users understand the scope and distribution of the synthetic data created.
         """
-        print("\nData Generation Statistics:")
+        # Build the whole report first so it is written in a single call
+        lines = ["\nData Generation Statistics:"]
         for table in self.table_order:
             row_count = len(self.generated_data.get(table, []))
-            print(f"Table '{table}': {row_count} row(s) generated.")
+            lines.append(f"Table '{table}': {row_count} row(s) generated.")
+        print("\n".join(lines))
@@ -168,3 +168,30 @@ def extract_allowed_values(constraints: list, col_name: str) -> list:
             allowed_values.extend(values)
     return allowed_values
 
+
+def batched_generator(draw_batch, batch_size: int = 10_000):
+    """
+    Wrap a batch-producing function into a per-row generator usable in `column_type_mappings`.
+
+    Calling a Faker method once per row is dominated by Python call overhead for large tables. This helper
+    lets a mapping draw `batch_size` values at once (e.g. with a NumPy random generator) and hands them out
+    one row at a time, so `DataGenerator` keeps using the regular `(fake, row)` callable protocol.
+
+    Args:
+        draw_batch (callable): A function taking the number of values to draw and returning a sequence of that
+            length (a list or a NumPy array). NumPy arrays are converted to native Python values.
+        batch_size (int, optional): The number of values drawn per call to `draw_batch`. Defaults to 10 000.
+
+    Returns:
+        callable:
+            A `(fake, row) -> value` function returning the next pre-drawn value on every call. For example:
+            `batched_generator(lambda n: rng.integers(1900, 2025, size=n))`
+    """
+
+    def values():
+        while True:
+            batch = draw_batch(batch_size)
+            yield from (batch.tolist() if hasattr(batch, 'tolist') else batch)
+
+    iterator = values()
+    return lambda fake, row: next(iterator)
@@ -1,4 +1,11 @@
+import copy
+import functools
+import hashlib
+import os
+import pickle
 import re
+import tempfile
+
 import sqlglot
 from sqlglot.expressions import (
     Create,
@@ -14,6 +21,16 @@ from sqlglot.expressions import (
     CheckColumnConstraint
 )
 
+# Optional on-disk parse cache, enabled by setting DATA_FILLER_PARSE_CACHE=1. Entries are keyed
+# by a digest of the SQL script, the dialect and the parser version (sqlglot version + mtime of
+# this module), so editing the parser or upgrading sqlglot invalidates stale entries automatically.
+_CACHE_ENV_VAR = 'DATA_FILLER_PARSE_CACHE'
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'data-filler', 'parse_cache'
+)
+_PARSER_VERSION = f"{sqlglot.__version__}:{os.path.getmtime(__file__)}"
+
 
 def parse_create_tables(sql_script, dialect='postgres'):
     """
@@ -34,6 +51,12 @@ def parse_create_tables(sql_script, dialect='postgres'):
             another dictionary containing columns, foreign keys, and other
             schema details.
 
+        Notes
+        -----
+        Results are memoized in-process. Setting the environment variable
+        ``DATA_FILLER_PARSE_CACHE=1`` also persists them on disk, under
+        ``$XDG_CACHE_HOME/data-filler/parse_cache`` (``~/.cache`` by default).
+
         Example
         -------
         >>> from parsing.parsing import parse_create_tables
@@ -78,6 +101,87 @@ def parse_create_tables(sql_script, dialect='postgres'):
         }
     """
 
+    # Results are cached, so hand out a copy the caller is free to mutate
+    return copy.deepcopy(_cached_parse(sql_script, dialect))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_parse(sql_script, dialect):
+    """
+    Return the parsed tables for a script, consulting the on-disk cache first when it is enabled.
+
+    Parameters
+    ----------
+    sql_script : str
+        The SQL script containing CREATE TABLE statements.
+    dialect : str
+        The SQL dialect to parse.
+
+    Returns
+    -------
+    dict
+        The parsed table definitions. Must not be mutated, as it is shared between calls.
+    """
+    if not _disk_cache_enabled():
+        return _parse_create_tables(sql_script, dialect)
+
+    digest = hashlib.blake2b(
+        f"{dialect}\0{_PARSER_VERSION}\0".encode('utf-8') + sql_script.encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"{digest}.pkl")
+
+    tables = _load_cache_entry(cache_path)
+    if tables is not None:
+        return tables
+
+    tables = _parse_create_tables(sql_script, dialect)
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is best-effort, a read-only home directory is fine
+
+    return tables
+
+
+def _disk_cache_enabled():
+    """
+    Tell whether the on-disk parse cache was enabled through the DATA_FILLER_PARSE_CACHE variable.
+    """
+    return os.environ.get(_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _load_cache_entry(cache_path):
+    """
+    Load a pickled cache entry, or return None on a miss.
+
+    An entry that cannot be loaded for any reason (truncated file, unknown pickle protocol,
+    a class that no longer exists, ...) is deleted, so the caller parses and rewrites it.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+
+def _parse_create_tables(sql_script, dialect):
+    """
+    Parse CREATE TABLE statements without any caching. See `parse_create_tables`.
+    """
+
     # Parse the SQL script with the appropriate dialect (e.g., 'postgres' or 'mysql')
     parsed = sqlglot.parse(sql_script, read=dialect)
     tables = {}
@@ -0,0 +1,11 @@
+import pytest
+from faker import Faker
+
+
+@pytest.fixture(scope="session")
+def shared_faker():
+    """
+    A single Faker instance shared by every DataGenerator in the session,
+    so Faker's providers are loaded once rather than once per generator.
+    """
+    return Faker()
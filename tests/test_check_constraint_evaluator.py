@@ -0,0 +1,32 @@
+from datetime import date
+
+import pytest
+
+from filling.check_constraint_evaluator import CheckConstraintEvaluator
+
+
+@pytest.fixture
+def evaluator():
+    return CheckConstraintEvaluator()
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-01-05", date(2024, 1, 5)),
+    ("2024-1-5", date(2024, 1, 5)),
+])
+def test_date_func_parses_dates(evaluator, value, expected):
+    assert evaluator.date_func(value) == expected
+
+
+@pytest.mark.parametrize("value", ["20240105", "2024-W01-1", "2024-13-01"])
+def test_date_func_rejects_non_iso_dates(evaluator, value):
+    """Only 'YYYY-MM-DD' is accepted, whatever extra formats date.fromisoformat supports."""
+    with pytest.raises(ValueError):
+        evaluator.date_func(value)
+
+
+def test_check_with_compact_date_is_false(evaluator):
+    """A CHECK over a date in a non-ISO format fails instead of being evaluated."""
+    check = "DATE(issue_date) > DATE('2000-01-01')"
+    assert evaluator.evaluate(check, {"issue_date": "2024-01-05"})
+    assert not evaluator.evaluate(check, {"issue_date": "20240105"})
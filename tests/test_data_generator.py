@@ -0,0 +1,56 @@
+import pytest
+
+from parsing import parse_create_tables
+from filling import DataGenerator
+
+
+@pytest.fixture
+def shop_data_generator(shared_faker):
+    """A DataGenerator over a two-table schema, with hand-written data instead of generated rows."""
+    tables = parse_create_tables("""
+    CREATE TABLE Customers (
+        customer_id SERIAL PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        email VARCHAR(100)
+    );
+
+    CREATE TABLE Orders (
+        order_id SERIAL PRIMARY KEY,
+        customer_id INT NOT NULL,
+        FOREIGN KEY (customer_id) REFERENCES Customers(customer_id)
+    );
+    """)
+    return DataGenerator(tables=tables, num_rows=2, faker=shared_faker)
+
+
+def test_get_columnar_data(shop_data_generator):
+    """Columns follow the schema order, missing keys become None and empty tables give empty columns."""
+    shop_data_generator.generated_data = {
+        # Keys deliberately out of schema order, with 'email' missing from the second row
+        'Customers': [
+            {'email': 'ann@example.com', 'name': 'Ann', 'customer_id': 1},
+            {'name': 'Bob', 'customer_id': 2},
+        ],
+        'Orders': [],
+    }
+
+    columns = shop_data_generator.get_columnar_data()
+
+    assert list(columns) == ['Customers', 'Orders']
+    assert list(columns['Customers']) == ['customer_id', 'name', 'email']
+    assert columns['Customers'] == {
+        'customer_id': [1, 2],
+        'name': ['Ann', 'Bob'],
+        'email': ['ann@example.com', None],
+    }
+    assert columns['Orders'] == {'order_id': [], 'customer_id': []}
+
+
+def test_get_columnar_data_matches_generated_rows(shop_data_generator):
+    """Every column lists the values of the generated rows, in row order."""
+    data = shop_data_generator.generate_data()
+    columns = shop_data_generator.get_columnar_data()
+
+    for table_name, rows in data.items():
+        for column_name, values in columns[table_name].items():
+            assert values == [row.get(column_name) for row in rows]
@@ -6,9 +6,12 @@ from datetime import date
 
 from parsing import parse_create_tables
 from filling import DataGenerator
+from tests.utils import missing_ids
 
+EMAIL_RE = re.compile(r'[\w.\-]+@[\w.\-]+\.\w{2,}')
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def ecommerce_sql_script_path():
     """
     Provide the path to the E-commerce schema .sql file.
@@ -16,13 +19,13 @@ def ecommerce_sql_script_path():
     return os.path.join("tests", "DB_infos/ecommerce_sql_script.sql")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ecommerce_sql_script(ecommerce_sql_script_path):
     with open(ecommerce_sql_script_path, "r", encoding="utf-8") as f:
         return f.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ecommerce_tables_parsed(ecommerce_sql_script):
     """
     Parse the CREATE TABLE statements from the ecommerce SQL script.
@@ -32,7 +35,7 @@ def ecommerce_tables_parsed(ecommerce_sql_script):
 
 
 @pytest.fixture
-def ecommerce_data_generator(ecommerce_tables_parsed):
+def ecommerce_data_generator(ecommerce_tables_parsed, shared_faker):
     """
     Returns a DataGenerator instance configured for the E-commerce schema.
     """
@@ -88,7 +91,8 @@ def ecommerce_data_generator(ecommerce_tables_parsed):
         num_rows=10,  # fallback if not in num_rows_per_table
         predefined_values=predefined_values,
         column_type_mappings=column_type_mappings,
-        num_rows_per_table=num_rows_per_table
+        num_rows_per_table=num_rows_per_table,
+        faker=shared_faker
     )
 
 
@@ -123,26 +127,30 @@ def test_constraints_ecommerce(ecommerce_data_generator):
     Advanced checks for E-commerce:
 
     - Customers table: email format
+    - Products, Orders, OrderItems, ProductSuppliers: no NULLs (all their columns are NOT NULL)
     - Products table: price > 0, stock_quantity >= 0
     - Orders table: customer_id references real Customer, total_amount >= 0
     - OrderItems: references Orders & Products, quantity > 0, price > 0
     - Suppliers & ProductSuppliers: references valid product_id & supplier_id, supply_price > 0
     """
     data = ecommerce_data_generator.generate_data()
+    columns = ecommerce_data_generator.get_columnar_data()
 
+    # Pass 1: build every key set up front, so the checks below never read a half-filled index
+    product_ids = set(columns["Products"]["product_id"])
+    order_ids = set(columns["Orders"]["order_id"])
+    supplier_ids = set(columns["Suppliers"]["supplier_id"])
+
+    # Pass 2: validate
     # 1) Customers
-    customer_ids = set()
     for cust in data.get("Customers", []):
-        cid = cust["customer_id"]
-        customer_ids.add(cid)
         email = cust.get("email")
-        assert re.match(r'^[\w\.-]+@[\w\.-]+\.\w{2,}$', email), f"Invalid email {email}"
+        assert EMAIL_RE.fullmatch(email), f"Invalid email {email}"
 
     # 2) Products
-    product_ids = set()
     for prod in data.get("Products", []):
-        pid = prod["product_id"]
-        product_ids.add(pid)
+        # Every Products column is NOT NULL, so one C-level scan covers them all
+        assert None not in prod.values(), f"Product has NULL column values: {prod}"
 
         price = prod["price"]
         stock = prod["stock_quantity"]
@@ -150,37 +158,34 @@ def test_constraints_ecommerce(ecommerce_data_generator):
         assert stock >= 0, f"Stock quantity must be >= 0, got {stock}"
 
     # 3) Orders => references Customer
-    order_ids = set()
     for order in data.get("Orders", []):
-        oid = order["order_id"]
-        order_ids.add(oid)
-
-        assert order["customer_id"] in customer_ids, (
-            f"Order references nonexistent customer_id {order['customer_id']}"
-        )
+        assert None not in order.values(), f"Order has NULL column values: {order}"
         assert order["total_amount"] >= 0, f"total_amount < 0, got {order['total_amount']}"
 
+    # FK check in one vectorized pass over the whole column
+    missing = missing_ids(columns["Customers"]["customer_id"], columns["Orders"]["customer_id"])
+    assert missing.size == 0, f"Orders reference nonexistent customer_ids {missing[:5]}"
+
     # 4) OrderItems => references Orders, Products
     for oi in data.get("OrderItems", []):
+        assert None not in oi.values(), f"OrderItem has NULL column values: {oi}"
         assert oi["order_id"] in order_ids, f"OrderItems references nonexistent order_id {oi['order_id']}"
         assert oi["product_id"] in product_ids, f"OrderItems references nonexistent product_id {oi['product_id']}"
         assert oi["quantity"] > 0, f"OrderItem quantity must be > 0, got {oi['quantity']}"
         assert oi["price"] > 0, f"OrderItem price must be > 0, got {oi['price']}"
 
     # 5) Suppliers => supply minimal checks
-    supplier_ids = set()
     for sup in data.get("Suppliers", []):
-        sid = sup["supplier_id"]
-        supplier_ids.add(sid)
         # If you want, check contact_email format
         contact_email = sup.get("contact_email")
         if contact_email:
-            assert re.match(r'^[\w\.-]+@[\w\.-]+\.\w{2,}$', contact_email), (
+            assert EMAIL_RE.fullmatch(contact_email), (
                 f"Invalid supplier contact_email {contact_email}"
             )
 
     # 6) ProductSuppliers => references Products, Suppliers
     for ps in data.get("ProductSuppliers", []):
+        assert None not in ps.values(), f"ProductSupplier has NULL column values: {ps}"
         assert ps["product_id"] in product_ids, (
             f"ProductSuppliers references nonexistent product_id {ps['product_id']}"
         )
@@ -6,7 +6,7 @@ from datetime import date
 from parsing import parse_create_tables
 from filling import DataGenerator
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def employees_sql_script():
     """
     Returns the CREATE TABLE statements for the employees database schema.
@@ -75,7 +75,7 @@ CREATE TABLE salaries (
 );
 """
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def employees_tables_parsed(employees_sql_script):
     """
     Parse the CREATE TABLE statements using your parse_create_tables() function.
@@ -84,7 +84,7 @@ def employees_tables_parsed(employees_sql_script):
     return parse_create_tables(employees_sql_script)
 
 @pytest.fixture
-def employees_data_generator(employees_tables_parsed):
+def employees_data_generator(employees_tables_parsed, shared_faker):
     """
     Create a DataGenerator (or any test-data generator) configured for the employees schema.
 
@@ -134,7 +134,8 @@ def employees_data_generator(employees_tables_parsed):
         tables=employees_tables_parsed,
         num_rows=5,  # fallback
         column_type_mappings=column_type_mappings,
-        num_rows_per_table=num_rows_per_table
+        num_rows_per_table=num_rows_per_table,
+        faker=shared_faker
     )
 
 def test_parse_employees_schema(employees_tables_parsed):
@@ -0,0 +1,38 @@
+import numpy as np
+
+from filling.helpers import batched_generator
+
+
+def test_batched_generator_refills_across_batches():
+    """Values are handed out in order, drawing a new batch once the current one runs out."""
+    draws = []
+
+    def draw_batch(n):
+        start = len(draws) * n
+        draws.append(n)
+        return list(range(start, start + n))
+
+    generate = batched_generator(draw_batch, batch_size=3)
+    assert draws == []  # Nothing is drawn before the first value is requested
+
+    values = [generate(None, {}) for _ in range(7)]
+    assert values == [0, 1, 2, 3, 4, 5, 6]
+    assert draws == [3, 3, 3]
+
+
+def test_batched_generator_accepts_lists():
+    """Plain lists are handed out unchanged."""
+    generate = batched_generator(lambda n: ['a'] * n, batch_size=2)
+    assert [generate(None, {}) for _ in range(3)] == ['a', 'a', 'a']
+
+
+def test_batched_generator_converts_numpy_values():
+    """NumPy arrays are converted, so rows hold native Python values."""
+    rng = np.random.default_rng(0)
+    ints = batched_generator(lambda n: rng.integers(1, 10, size=n), batch_size=4)
+    floats = batched_generator(lambda n: rng.random(size=n), batch_size=4)
+    strings = batched_generator(lambda n: np.char.mod('%03d', np.arange(n)), batch_size=4)
+
+    assert type(ints(None, {})) is int
+    assert type(floats(None, {})) is float
+    assert [strings(None, {}) for _ in range(5)] == ['000', '001', '002', '003', '000']
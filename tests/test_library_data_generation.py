@@ -2,29 +2,46 @@ import os
 import re
 import pytest
 from datetime import date
+from operator import itemgetter
+
+import numpy as np
 
 from parsing import parse_create_tables
 from filling import DataGenerator
+from filling.helpers import batched_generator
+from tests.utils import missing_ids
+
+EMAIL_RE = re.compile(r'[\w.\-]+@[\w.\-]+\.\w{2,}')
+
+
+def primary_key_ids(rows, column):
+    """Collect an integer PK column into a sorted int64 array, asserting it has no duplicates."""
+    ids, counts = np.unique(
+        np.fromiter((row[column] for row in rows), dtype=np.int64, count=len(rows)), return_counts=True
+    )
+    assert (counts == 1).all(), f"Duplicate {column} values {ids[counts > 1][:5]}"
+    return ids
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def library_sql_script_path():
     return os.path.join("tests", "DB_infos/library_sql_script.sql")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def library_sql_script(library_sql_script_path):
     with open(library_sql_script_path, "r", encoding="utf-8") as f:
         return f.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def library_tables_parsed(library_sql_script):
+    # Shared by every test in the module; DataGenerator never mutates the parsed tables
     return parse_create_tables(library_sql_script)
 
 
-@pytest.fixture
-def library_data_generator(library_tables_parsed):
+@pytest.fixture(scope="module")
+def library_data_generator(library_tables_parsed, shared_faker):
     """
     Config for Library schema, with custom mappings for
     Authors, Books, Members, etc.
@@ -41,6 +58,18 @@ def library_data_generator(library_tables_parsed):
             ]
         },
     }
+    rng = np.random.default_rng()
+    today_year = date.today().year
+    # Defined first, so each batched column draws exactly one table's worth of values per batch
+    num_rows_per_table = {
+        'Authors': 10,
+        'Categories': 5,
+        'Books': 30,
+        'Members': 10,
+        'Loans': 15,
+        'Penalties': 5,
+    }
+
     column_type_mappings = {
         'Authors': {
             'sex': lambda fake, row: fake.random_element(elements=('M','F')),
@@ -49,9 +78,17 @@ def library_data_generator(library_tables_parsed):
             'birth_date': lambda fake, row: fake.date_of_birth(minimum_age=25, maximum_age=90),
         },
         'Books': {
-            'isbn': lambda fake, row: ''.join(str(fake.random_digit()) for _ in range(13)),
-            'publication_year': lambda fake, row: fake.random_int(min=1900, max=date.today().year),
-            'penalty_rate': lambda fake, row: float(fake.random_int(min=1, max=30)),
+            # One zero-padded 13-digit string per drawn integer
+            'isbn': batched_generator(
+                lambda n: np.char.mod('%013d', rng.integers(0, 10 ** 13, size=n, dtype=np.int64)),
+                batch_size=num_rows_per_table['Books']
+            ),
+            'publication_year': batched_generator(
+                lambda n: rng.integers(1900, today_year + 1, size=n), batch_size=num_rows_per_table['Books']
+            ),
+            'penalty_rate': batched_generator(
+                lambda n: rng.integers(1, 31, size=n).astype(float), batch_size=num_rows_per_table['Books']
+            ),
         },
         'Members': {
             'email': 'email',
@@ -62,28 +99,29 @@ def library_data_generator(library_tables_parsed):
             'due_date': lambda fake, row: fake.date_between(start_date='-2y', end_date='today'),
         },
         'Penalties': {
-            'penalty_amount': lambda fake, row: float(fake.random_int(min=1, max=100)),
+            'penalty_amount': batched_generator(
+                lambda n: rng.integers(1, 101, size=n).astype(float), batch_size=num_rows_per_table['Penalties']
+            ),
             'penalty_date': lambda fake, row: fake.date_between(start_date='-2y', end_date='today'),
         }
     }
-    num_rows_per_table = {
-        'Authors': 10,
-        'Categories': 5,
-        'Books': 30,
-        'Members': 10,
-        'Loans': 15,
-        'Penalties': 5,
-    }
 
     return DataGenerator(
         tables=library_tables_parsed,
         num_rows=10,
         predefined_values=predefined_values,
         column_type_mappings=column_type_mappings,
-        num_rows_per_table=num_rows_per_table
+        num_rows_per_table=num_rows_per_table,
+        faker=shared_faker
     )
 
 
+@pytest.fixture(scope="module")
+def library_generated_data(library_data_generator):
+    """Generate the Library dataset once and share it across the module's tests."""
+    return library_data_generator.generate_data()
+
+
 def test_parse_create_tables_library(library_tables_parsed):
     """Ensure the Library schema is parsed into table definitions."""
     assert len(library_tables_parsed) > 0, "No tables parsed from library_sql_script.sql"
@@ -93,26 +131,41 @@ def test_parse_create_tables_library(library_tables_parsed):
     )
 
 
-def test_generate_data_library(library_data_generator):
+def test_generate_data_library(library_data_generator, library_generated_data):
     """Check that data is generated for each Library table."""
-    fake_data = library_data_generator.generate_data()
+    fake_data = library_generated_data
     for table_name in library_data_generator.tables.keys():
         assert table_name in fake_data, f"Missing data for table {table_name}"
         assert len(fake_data[table_name]) > 0, f"No rows generated for table {table_name}"
 
 
-def test_export_sql_library(library_data_generator):
+def test_export_sql_library(library_data_generator, library_generated_data):
     """Simple check for INSERT statements and known table names."""
-    library_data_generator.generate_data()
     sql_output = library_data_generator.export_as_sql_insert_query()
     assert "INSERT INTO" in sql_output, "No INSERT statements found in SQL"
     assert "Authors" in sql_output, "Expected table 'Authors' not found in SQL"
 
 
-def test_constraints_library(library_data_generator):
+def test_validate_rows_bulk_library(library_data_generator, library_generated_data):
+    """Generated rows pass bulk validation, and a row breaking a CHECK is reported by index."""
+    for table_name in library_data_generator.tables.keys():
+        violations = library_data_generator.validate_rows_bulk(table_name)
+        assert violations == [], f"Invalid rows in {table_name}: {violations[:5]}"
+
+    books = [dict(book) for book in library_generated_data["Books"][:3]]
+    books[1]["publication_year"] = 1800
+    books[2]["title"] = None
+    violations = library_data_generator.validate_rows_bulk("Books", books)
+    assert [index for index, _ in violations] == [1, 2]
+    assert violations[0][1].startswith("CHECK constraint")
+    assert violations[1][1] == "NOT NULL constraint on column 'title'"
+
+
+def test_constraints_library(library_generated_data):
     """
     Advanced checks for the Library schema:
 
+    0) Integer primary keys are unique in every table
     1) Authors & Categories are each valid on their own
     2) Books references Authors & Categories
     3) Members exist on their own
@@ -120,69 +173,68 @@ def test_constraints_library(library_data_generator):
     5) Penalties references Loans
     6) Validate typical constraints (ISBN, penalty_rate > 0, etc.)
     """
-    data = library_data_generator.generate_data()
+    data = library_generated_data
+    current_year = date.today().year
+
+    # Fetch every column a check needs with one C-level call per row
+    get_author = itemgetter("sex", "first_name", "last_name", "birth_date")
+    get_loan = itemgetter("loan_date", "due_date", "return_date")
 
     # 1) Check Authors
-    author_ids = set()
+    author_ids = primary_key_ids(data.get("Authors", []), "author_id")
     for author in data.get("Authors", []):
-        aid = author["author_id"]
-        author_ids.add(aid)
+        sex, first_name, last_name, birth_date = get_author(author)
 
         # Basic checks
-        assert author["sex"] in ("M","F"), f"Invalid sex {author['sex']}"
-        assert author["first_name"], "Author first_name is blank"
-        assert author["last_name"], "Author last_name is blank"
-        assert author["birth_date"], "birth_date is missing"
+        assert sex in ("M","F"), f"Invalid sex {sex}"
+        assert first_name, "Author first_name is blank"
+        assert last_name, "Author last_name is blank"
+        assert birth_date, "birth_date is missing"
 
     # 2) Check Categories
-    category_ids = set()
+    category_ids = primary_key_ids(data.get("Categories", []), "category_id")
     for cat in data.get("Categories", []):
-        cid = cat["category_id"]
-        category_ids.add(cid)
         assert cat["category_name"], "category_name is blank"
 
     # 3) Check Books => references Authors & Categories
-    book_ids = set()
-    for book in data.get("Books", []):
-        bid = book["book_id"]
-        book_ids.add(bid)
-
+    books = data.get("Books", [])
+    book_ids = primary_key_ids(books, "book_id")
+    for book in books:
         isbn = book["isbn"]
         assert len(isbn) == 13 and isbn.isdigit(), f"Invalid ISBN: {isbn}"
-        pub_year = book["publication_year"]
-        assert 1900 <= pub_year <= date.today().year, f"Invalid publication_year {pub_year}"
-        assert book["penalty_rate"] > 0, f"penalty_rate must be positive, got {book['penalty_rate']}"
 
-        # FK checks
-        assert book["author_id"] in author_ids, (
-            f"Book references nonexistent author_id {book['author_id']}"
-        )
-        assert book["category_id"] in category_ids, (
-            f"Book references nonexistent category_id {book['category_id']}"
-        )
+    # Range and FK checks run column-wise, reporting every offending row at once
+    pub_years = np.array([book["publication_year"] for book in books])
+    bad_years = np.where((pub_years < 1900) | (pub_years > current_year))[0]
+    assert bad_years.size == 0, f"Invalid publication_year at indices {bad_years[:5]}: {pub_years[bad_years[:5]]}"
 
-    # 4) Check Members
-    member_ids = set()
-    for mem in data.get("Members", []):
-        mid = mem["member_id"]
-        member_ids.add(mid)
+    penalty_rates = np.array([book["penalty_rate"] for book in books], dtype=float)
+    bad_rates = np.where(penalty_rates <= 0)[0]
+    assert bad_rates.size == 0, f"penalty_rate must be positive, got {penalty_rates[bad_rates[:5]]}"
 
-        email = mem["email"]
-        assert re.match(r'^[\w\.-]+@[\w\.-]+\.\w{2,}$', email), f"Invalid email {email}"
+    missing = missing_ids(author_ids, (book["author_id"] for book in books))
+    assert missing.size == 0, f"Books reference nonexistent author_ids {missing[:5]}"
+    missing = missing_ids(category_ids, (book["category_id"] for book in books))
+    assert missing.size == 0, f"Books reference nonexistent category_ids {missing[:5]}"
+
+    # 4) Check Members
+    members = data.get("Members", [])
+    member_ids = primary_key_ids(members, "member_id")
+    bad_email = next((mem["email"] for mem in members if not EMAIL_RE.fullmatch(mem["email"])), None)
+    assert bad_email is None, f"Invalid email {bad_email}"
+    for mem in members:
         assert mem["registration_date"], "registration_date is missing"
 
     # 5) Check Loans => references Books & Members
-    loan_ids = set()
-    for loan in data.get("Loans", []):
-        lid = loan["loan_id"]
-        loan_ids.add(lid)
+    loans = data.get("Loans", [])
+    loan_ids = primary_key_ids(loans, "loan_id")
+    missing = missing_ids(book_ids, (loan["book_id"] for loan in loans))
+    assert missing.size == 0, f"Loans reference nonexistent book_ids {missing[:5]}"
+    missing = missing_ids(member_ids, (loan["member_id"] for loan in loans))
+    assert missing.size == 0, f"Loans reference nonexistent member_ids {missing[:5]}"
 
-        assert loan["book_id"] in book_ids, f"Loan references nonexistent book_id {loan['book_id']}"
-        assert loan["member_id"] in member_ids, f"Loan references nonexistent member_id {loan['member_id']}"
-
-        loan_date = loan["loan_date"]
-        due_date = loan["due_date"]
-        return_date = loan.get("return_date")
+    for loan in loans:
+        loan_date, due_date, return_date = get_loan(loan)
 
         assert due_date > loan_date, (
             f"due_date {due_date} not > loan_date {loan_date}"
@@ -193,9 +245,12 @@ def test_constraints_library(library_data_generator):
             )
 
     # 6) Check Penalties => references Loans
-    for pen in data.get("Penalties", []):
-        assert pen["loan_id"] in loan_ids, f"Penalty references nonexistent loan_id {pen['loan_id']}"
-        amount = pen["penalty_amount"]
-        assert amount > 0, f"penalty_amount must be > 0, got {amount}"
+    penalties = data.get("Penalties", [])
+    missing = missing_ids(loan_ids, (pen["loan_id"] for pen in penalties))
+    assert missing.size == 0, f"Penalties reference nonexistent loan_ids {missing[:5]}"
+
+    amounts = np.array([pen["penalty_amount"] for pen in penalties], dtype=float)
+    bad_amounts = np.where(amounts <= 0)[0]
+    assert bad_amounts.size == 0, f"penalty_amount must be > 0, got {amounts[bad_amounts[:5]]}"
+    for pen in penalties:
         assert pen["penalty_date"], "penalty_date is missing"
-
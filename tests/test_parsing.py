@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from parsing import parse_create_tables
+from parsing import parsing as parsing_module
+
+
+@pytest.fixture
+def members_sql():
+    return """
+    CREATE TABLE Members (
+        member_id SERIAL PRIMARY KEY,
+        email VARCHAR(100) NOT NULL UNIQUE,
+        age INT NOT NULL,
+        CONSTRAINT chk_age CHECK (age >= 18)
+    );
+    """
+
+
+@pytest.fixture
+def disk_cache_dir(tmp_path, monkeypatch):
+    """
+    Enable the on-disk parse cache, pointed at a temporary directory, with an empty in-memory cache.
+    """
+    monkeypatch.setenv("DATA_FILLER_PARSE_CACHE", "1")
+    monkeypatch.setattr(parsing_module, "_CACHE_DIR", str(tmp_path))
+    parsing_module._cached_parse.cache_clear()
+    yield tmp_path
+    parsing_module._cached_parse.cache_clear()
+
+
+def cache_entries(cache_dir):
+    return sorted(cache_dir.glob("*.pkl"))
+
+
+def test_cached_result_is_independent(members_sql):
+    """
+    Parsing the same script again hits the in-memory cache, but must still hand out
+    a fresh copy that callers can mutate without affecting later calls.
+    """
+    first = parse_create_tables(members_sql)
+    expected = parse_create_tables(members_sql)
+
+    first["Members"]["columns"].clear()
+    first["Members"]["primary_key"].append("email")
+
+    second = parse_create_tables(members_sql)
+    assert second == expected
+    assert second["Members"]["columns"] is not first["Members"]["columns"]
+
+
+def test_disk_cached_result_is_independent(disk_cache_dir, members_sql):
+    """Results loaded from the on-disk cache are fresh copies as well."""
+    expected = parse_create_tables(members_sql)
+    parsing_module._cached_parse.cache_clear()
+
+    first = parse_create_tables(members_sql)
+    assert first == expected
+    first.pop("Members")
+
+    assert parse_create_tables(members_sql) == expected
+    parsing_module._cached_parse.cache_clear()
+    assert parse_create_tables(members_sql) == expected
+
+
+def test_disk_cache_disabled_by_default(tmp_path, monkeypatch, members_sql):
+    """Without the environment variable, parsing never touches the cache directory."""
+    monkeypatch.delenv("DATA_FILLER_PARSE_CACHE", raising=False)
+    monkeypatch.setattr(parsing_module, "_CACHE_DIR", str(tmp_path / "parse_cache"))
+    parsing_module._cached_parse.cache_clear()
+
+    assert "Members" in parse_create_tables(members_sql)
+    assert not (tmp_path / "parse_cache").exists()
+    parsing_module._cached_parse.cache_clear()
+
+
+def test_disk_cache_hit(disk_cache_dir, monkeypatch, members_sql):
+    """A second process-level call reads the stored entry instead of parsing again."""
+    expected = parse_create_tables(members_sql)
+    assert len(cache_entries(disk_cache_dir)) == 1
+
+    parsing_module._cached_parse.cache_clear()
+
+    def fail_parse(sql_script, dialect):
+        raise AssertionError("The script was parsed again despite a cache entry")
+
+    monkeypatch.setattr(parsing_module, "_parse_create_tables", fail_parse)
+    assert parse_create_tables(members_sql) == expected
+
+
+@pytest.mark.parametrize("payload", [b"", b"\x80\x09", b"\x80\x04\x95garbage", b"cno_such_module\nThing\n."])
+def test_disk_cache_corrupted_entry(disk_cache_dir, members_sql, payload):
+    """An unreadable entry is discarded and replaced by a freshly parsed one."""
+    expected = parse_create_tables(members_sql)
+    (entry,) = cache_entries(disk_cache_dir)
+    entry.write_bytes(payload)
+
+    parsing_module._cached_parse.cache_clear()
+    assert parse_create_tables(members_sql) == expected
+    assert entry.read_bytes() != payload
+
+
+def test_disk_cache_version_change(disk_cache_dir, monkeypatch, members_sql):
+    """A new parser version never reuses entries written by an older one."""
+    parse_create_tables(members_sql)
+    (old_entry,) = cache_entries(disk_cache_dir)
+
+    monkeypatch.setattr(parsing_module, "_PARSER_VERSION", "new-version")
+    parsing_module._cached_parse.cache_clear()
+    parse_create_tables(members_sql)
+
+    entries = cache_entries(disk_cache_dir)
+    assert len(entries) == 2 and old_entry in entries
+
+
+def test_disk_cache_unwritable_directory(tmp_path, monkeypatch, members_sql):
+    """A cache directory that cannot be created does not break parsing."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv("DATA_FILLER_PARSE_CACHE", "1")
+    monkeypatch.setattr(parsing_module, "_CACHE_DIR", os.path.join(str(blocker), "parse_cache"))
+    parsing_module._cached_parse.cache_clear()
+
+    assert "Members" in parse_create_tables(members_sql)
+    parsing_module._cached_parse.cache_clear()
@@ -7,7 +7,7 @@ from parsing import parse_create_tables
 from filling import DataGenerator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def various_pk_sql():
     """
     A single fixture returning multiple table definitions,
@@ -53,7 +53,7 @@ def various_pk_sql():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def various_pk_tables_parsed(various_pk_sql):
     """
     Parse the multi-table DDL above (with your parse_create_tables).
@@ -63,7 +63,7 @@ def various_pk_tables_parsed(various_pk_sql):
 
 
 @pytest.fixture
-def various_pk_data_generator(various_pk_tables_parsed):
+def various_pk_data_generator(various_pk_tables_parsed, shared_faker):
     """
     Create a DataGenerator that handles these four tables.
     We'll define custom column mappings as needed.
@@ -101,7 +101,8 @@ def various_pk_data_generator(various_pk_tables_parsed):
         tables=various_pk_tables_parsed,
         num_rows=5,  # fallback for any table not in num_rows_per_table
         column_type_mappings=column_type_mappings,
-        num_rows_per_table=num_rows_per_table
+        num_rows_per_table=num_rows_per_table,
+        faker=shared_faker
     )
 
 
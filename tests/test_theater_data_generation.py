@@ -1,44 +1,71 @@
 import os
 import re
 import pytest
+from collections import Counter
+from operator import itemgetter
+import numpy as np
+
 from parsing import parse_create_tables
 from filling import DataGenerator
+from filling.helpers import batched_generator
+from tests.utils import missing_ids
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def theater_sql_script_path():
     return os.path.join("tests", "DB_infos/theater_sql_script.sql")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def theater_sql_script(theater_sql_script_path):
     with open(theater_sql_script_path, "r", encoding="utf-8") as f:
         return f.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def theater_tables_parsed(theater_sql_script):
+    # Shared by every test in the module; DataGenerator never mutates the parsed tables
     return parse_create_tables(theater_sql_script)
 
 
-@pytest.fixture
-def theater_data_generator(theater_tables_parsed):
+@pytest.fixture(scope="module")
+def theater_data_generator(theater_tables_parsed, shared_faker):
     """
     Returns a DataGenerator instance configured for the Theater schema.
     """
     predefined_values = {}
+    rng = np.random.default_rng()
+    # Defined first, so each batched column draws exactly one table's worth of values per batch
+    num_rows_per_table = {
+        'Theaters': 5,
+        'Seats': 50,
+        'Movies': 10,
+        'Shows': 20,
+        'Tickets': 50,
+    }
+
     column_type_mappings = {
         'Theaters': {
             'name': lambda fake, row: fake.word()[:10],  # ensuring <= 10 chars
-            'capacity': lambda fake, row: fake.random_int(min=1, max=199),
+            'capacity': batched_generator(
+                lambda n: rng.integers(1, 200, size=n), batch_size=num_rows_per_table['Theaters']
+            ),
         },
         'Movies': {
-            'duration': lambda fake, row: fake.random_int(min=60, max=200),
-            'penalty_rate': lambda fake, row: float(fake.random_int(min=1, max=50)),
+            'duration': batched_generator(
+                lambda n: rng.integers(60, 201, size=n), batch_size=num_rows_per_table['Movies']
+            ),
+            'penalty_rate': batched_generator(
+                lambda n: rng.integers(1, 51, size=n).astype(float), batch_size=num_rows_per_table['Movies']
+            ),
         },
         'Seats': {
-            'row': lambda fake, row: fake.random_int(min=1, max=20),
-            'seat': lambda fake, row: fake.random_int(min=1, max=25),
+            'row': batched_generator(
+                lambda n: rng.integers(1, 21, size=n), batch_size=num_rows_per_table['Seats']
+            ),
+            'seat': batched_generator(
+                lambda n: rng.integers(1, 26, size=n), batch_size=num_rows_per_table['Seats']
+            ),
         },
         'Shows': {
             'show_date': lambda fake, row: fake.date_between(start_date='-40y', end_date='today'),
@@ -48,23 +75,23 @@ def theater_data_generator(theater_tables_parsed):
             'price': lambda fake, row: round(fake.random_number(digits=3, fix_len=False), 2),
         }
     }
-    num_rows_per_table = {
-        'Theaters': 5,
-        'Seats': 50,
-        'Movies': 10,
-        'Shows': 20,
-        'Tickets': 50,
-    }
 
     return DataGenerator(
         tables=theater_tables_parsed,
         num_rows=10,
         predefined_values=predefined_values,
         column_type_mappings=column_type_mappings,
-        num_rows_per_table=num_rows_per_table
+        num_rows_per_table=num_rows_per_table,
+        faker=shared_faker
     )
 
 
+@pytest.fixture(scope="module")
+def theater_generated_data(theater_data_generator):
+    """Generate the Theater dataset once and share it across the module's tests."""
+    return theater_data_generator.generate_data()
+
+
 def test_parse_create_tables_theater(theater_tables_parsed):
     """Check that the theater schema is parsed properly."""
     assert len(theater_tables_parsed) > 0, "No tables parsed from theater_sql_script.sql"
@@ -74,23 +101,22 @@ def test_parse_create_tables_theater(theater_tables_parsed):
     )
 
 
-def test_generate_data_theater(theater_data_generator):
+def test_generate_data_theater(theater_data_generator, theater_generated_data):
     """Verify we get non-empty results for each table."""
-    fake_data = theater_data_generator.generate_data()
+    fake_data = theater_generated_data
     for table_name in theater_data_generator.tables.keys():
         assert table_name in fake_data, f"Missing data for table {table_name}"
         assert len(fake_data[table_name]) > 0, f"No rows generated for table {table_name}"
 
 
-def test_export_sql_theater(theater_data_generator):
+def test_export_sql_theater(theater_data_generator, theater_generated_data):
     """Basic check that the generated SQL has insert statements and references a known table."""
-    theater_data_generator.generate_data()
     sql_output = theater_data_generator.export_as_sql_insert_query()
     assert "INSERT INTO" in sql_output
     assert "Theaters" in sql_output
 
 
-def test_constraints_theater(theater_data_generator):
+def test_constraints_theater(theater_generated_data):
     """
     Advanced checks for Theater schema:
 
@@ -100,59 +126,75 @@ def test_constraints_theater(theater_data_generator):
     4) Shows: references Theaters & Movies
     5) Tickets: references Shows(show_id) and composite seat (row, seat, theater_id)
     """
-    data = theater_data_generator.generate_data()
+    data = theater_generated_data
+
+    # Fetch every column a check needs with one C-level call per row
+    get_theater = itemgetter("theater_id", "name", "capacity")
+    get_movie = itemgetter("movie_id", "duration", "penalty_rate")
+    get_seat = itemgetter("theater_id", "row", "seat")
+    get_show = itemgetter("show_id", "show_date", "show_starts_at")
+    get_ticket = itemgetter("price", "theater_id", "row", "seat")
 
     # 1) Theaters
     theater_ids = set()
     for t in data.get("Theaters", []):
-        tid = t["theater_id"]
+        tid, name, cap = get_theater(t)
         theater_ids.add(tid)
 
-        name = t["name"]
         assert 1 <= len(name) <= 10, f"Theater name must be between 1..10 chars, got '{name}'"
-        cap = t["capacity"]
         assert 0 < cap < 200, f"Theater capacity out of range: {cap}"
 
     # 2) Movies
     movie_ids = set()
     for m in data.get("Movies", []):
-        mid = m["movie_id"]
+        mid, dur, rate = get_movie(m)
         movie_ids.add(mid)
-        dur = m["duration"]
-        rate = m["penalty_rate"]
         assert 60 <= dur <= 200, f"Movie duration out of range: {dur}"
         assert rate > 0, f"penalty_rate must be > 0, got {rate}"
 
     # 3) Seats => (row, seat, theater_id) unique + theater_id references Theaters
-    seat_keys = set()
-    for s in data.get("Seats", []):
-        key = (s["row"], s["seat"], s["theater_id"])
-        assert key not in seat_keys, f"Duplicate seat (row={key[0]}, seat={key[1]}, theater_id={key[2]})"
-        seat_keys.add(key)
-        # FK check
-        assert s["theater_id"] in theater_ids, f"seat references nonexistent theater_id {s['theater_id']}"
+    # The fixture keeps row <= 20 and seat <= 25, so the composite key packs into one int
+    seat_counts = Counter(
+        (theater_id << 16) | (row << 8) | seat
+        for theater_id, row, seat in map(get_seat, data.get("Seats", []))
+    )
+    duplicates = [
+        f"(row={(key >> 8) & 0xFF}, seat={key & 0xFF}, theater_id={key >> 16})"
+        for key, count in seat_counts.items() if count > 1
+    ]
+    assert not duplicates, f"Duplicate seats {duplicates[:5]}"
+    seat_keys = seat_counts.keys()
+
+    # FK check
+    missing = missing_ids(theater_ids, (s["theater_id"] for s in data.get("Seats", [])))
+    assert missing.size == 0, f"Seats reference nonexistent theater_ids {missing[:5]}"
 
     # 4) Shows => references Theaters + Movies
     show_ids = set()
     for sh in data.get("Shows", []):
-        sid = sh["show_id"]
+        sid, show_date, show_starts_at = get_show(sh)
         show_ids.add(sid)
 
-        assert sh["theater_id"] in theater_ids, f"Shows references nonexistent theater_id {sh['theater_id']}"
-        assert sh["movie_id"] in movie_ids, f"Shows references nonexistent movie_id {sh['movie_id']}"
-
         # Basic check for show_date, show_starts_at
-        assert sh["show_date"], "show_date is missing"
-        assert sh["show_starts_at"], "show_starts_at is missing"
+        assert show_date, "show_date is missing"
+        assert show_starts_at, "show_starts_at is missing"
+
+    missing = missing_ids(theater_ids, (sh["theater_id"] for sh in data.get("Shows", [])))
+    assert missing.size == 0, f"Shows reference nonexistent theater_ids {missing[:5]}"
+    missing = missing_ids(movie_ids, (sh["movie_id"] for sh in data.get("Shows", [])))
+    assert missing.size == 0, f"Shows reference nonexistent movie_ids {missing[:5]}"
 
     # 5) Tickets => references Shows(show_id) + Seats(row, seat, theater_id)
+    missing = missing_ids(show_ids, (tk["show_id"] for tk in data.get("Tickets", [])))
+    assert missing.size == 0, f"Tickets reference nonexistent show_ids {missing[:5]}"
+
     for tk in data.get("Tickets", []):
+        price, theater_id, row, seat = get_ticket(tk)
         # Price must be >= 0
-        assert tk["price"] >= 0, f"Ticket price < 0, got {tk['price']}"
-
-        # Check show_id in Show
-        assert tk["show_id"] in show_ids, f"Ticket references nonexistent show_id {tk['show_id']}"
+        assert price >= 0, f"Ticket price < 0, got {price}"
 
         # Check row/seat/theater_id in Seats
-        seat_key = (tk["row"], tk["seat"], tk["theater_id"])
-        assert seat_key in seat_keys, f"Ticket references nonexistent seat {seat_key}"
\ No newline at end of file
+        seat_key = (theater_id << 16) | (row << 8) | seat
+        assert seat_key in seat_keys, (
+            f"Ticket references nonexistent seat (row={row}, seat={seat}, theater_id={theater_id})"
+        )
\ No newline at end of file
@@ -0,0 +1,16 @@
+import numpy as np
+
+
+def missing_ids(parent_ids, child_ids):
+    """
+    Return the child ids with no match in parent_ids, as an int64 array.
+
+    Foreign key checks in the tests go through this helper, so every schema reports
+    missing references the same way. The lookup bisects a sorted copy of the parent ids.
+    """
+    parent = np.sort(np.fromiter(parent_ids, dtype=np.int64))
+    child = np.fromiter(child_ids, dtype=np.int64)
+    if parent.size == 0:
+        return child
+    idx = np.searchsorted(parent, child).clip(max=parent.size - 1)
+    return child[parent[idx] != child]